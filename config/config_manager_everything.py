@@ -1,61 +1,201 @@
 import os
-import configparser
-from typing import Dict, Any
+import re
+import sys
+import functools
+from itertools import islice
+from types import MappingProxyType
+from typing import Mapping
+
+_BOOL_STATES = {'true': True, '1': True, 'yes': True, 'on': True,
+                'false': False, '0': False, 'no': False, 'off': False}
+
+_DELIMITER = re.compile('[=:]')
+
+_HOT_MAX = 100
+_HOT_EVICT = 20
+
+_CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config')
+_CONFIG_FILE = os.path.join(_CONFIG_DIR, 'config-everything.ini')
+_config_dir_ready = False
+
+# Default values
+_DEFAULTS = MappingProxyType({
+    'Interface': MappingProxyType({
+        'language': 'English'
+    }),
+    'Search': MappingProxyType({
+        'regex_filter': ''
+    }),
+    'Output': MappingProxyType({
+        'enable_logging': 'False',
+        'match_folder_structure': 'True'
+    }),
+    'Paths': MappingProxyType({
+        'default_copy_folder': '',
+        'default_move_folder': ''
+    })
+})
+
+# Interned flat keys for settings read on hot paths
+KEY_LANGUAGE = sys.intern('Interface.language')
+KEY_REGEX_FILTER = sys.intern('Search.regex_filter')
+KEY_ENABLE_LOGGING = sys.intern('Output.enable_logging')
+KEY_MATCH_FOLDER_STRUCTURE = sys.intern('Output.match_folder_structure')
+KEY_DEFAULT_COPY_FOLDER = sys.intern('Paths.default_copy_folder')
+KEY_DEFAULT_MOVE_FOLDER = sys.intern('Paths.default_move_folder')
+
+def _parse_ini(text, store):
+    """Parse INI text into a flat 'section.key' -> value dict"""
+    section = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in '#;':
+            continue
+        if line[0] == '[':
+            section = line[1:-1].strip()
+            continue
+        # Split on whichever delimiter comes first, as ConfigParser does
+        match = _DELIMITER.search(line)
+        if section is None or match is None:
+            continue
+        key, value = line[:match.start()], line[match.end():]
+        store[f"{section}.{key.strip().lower()}"] = value.strip()
+    return store
+
+def _format_ini(store):
+    """Serialize a flat 'section.key' -> value dict to INI text"""
+    sections = {}
+    for flat_key, value in store.items():
+        section, _, key = flat_key.partition('.')
+        sections.setdefault(section, []).append(f"{key} = {value}\n")
+    return "".join(f"[{section}]\n{''.join(lines)}\n" for section, lines in sections.items())
 
 class ConfigManagerEverything:
     def __init__(self):
-        self.config = configparser.ConfigParser()
-        self.config_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config/config-everything.ini')
+        self.config_file = _CONFIG_FILE
+        
+        # The config file is read on first access
+        self._loaded = False
+        self._file_text = None
+        self._dirty = False
+        self._cache = {f"{s}.{k}": v for s, keys in _DEFAULTS.items() for k, v in keys.items()}
         
-        # Set default values
-        self.config['Interface'] = {
-            'language': 'English'
-        }
-        self.config['Search'] = {
-            'regex_filter': ''
-        }
-        self.config['Output'] = {
-            'enable_logging': 'False',
-            'match_folder_structure': 'True'
-        }
-        self.config['Paths'] = {
-            'default_copy_folder': '',
-            'default_move_folder': ''
-        }
+        # Small bounded tier in front of the main cache for repeatedly read keys
+        self._hot = {}
+        self._hits = 0
+        self._misses = 0
+        
+        # Read-only snapshot returned by get_all_settings, rebuilt after changes
+        self._all_cache = None
+    
+    def _ensure_loaded(self):
+        """Load the config file and build the value cache on first use"""
+        if self._loaded:
+            return
+        self._loaded = True
         
-        # Load existing config if it exists
-        if os.path.exists(self.config_file):
-            self.config.read(self.config_file, encoding='utf-8')
+        # Load existing config if it exists and is not empty
+        try:
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        if data:
+            self._file_text = data.decode('utf-8')
+            _parse_ini(self._file_text, self._cache)
     
     def get(self, section, key, default=None):
         """Get a value from the config"""
-        try:
-            return self.config.get(section, key)
-        except (configparser.NoSectionError, configparser.NoOptionError):
+        return self.get_flat(f"{section}.{key}", default)
+    
+    def get_flat(self, flat_key, default=None):
+        """Get a value from the config by its 'section.key' name"""
+        value = self._hot.get(flat_key)
+        if value is not None:
+            self._hits += 1
+            return value
+        self._misses += 1
+        self._ensure_loaded()
+        value = self._cache.get(flat_key)
+        if value is None:
             return default
+        if len(self._hot) >= _HOT_MAX:
+            for old_key in list(islice(self._hot, _HOT_EVICT)):
+                del self._hot[old_key]
+        self._hot[flat_key] = value
+        return value
     
     def get_bool(self, section, key, default=False):
         """Get a boolean value from the config"""
-        try:
-            return self.config.getboolean(section, key)
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            return default
+        return self.get_bool_flat(f"{section}.{key}", default)
+    
+    def get_bool_flat(self, flat_key, default=False):
+        """Get a boolean value from the config by its 'section.key' name"""
+        if not self._loaded:
+            self._ensure_loaded()
+        value = self._cache.get(flat_key)
+        return default if value is None else _BOOL_STATES.get(value.lower(), default)
     
     def set(self, section, key, value):
         """Set a value in the config"""
-        if not self.config.has_section(section):
-            self.config.add_section(section)
-        self.config.set(section, key, str(value))
+        self.set_flat(f"{section}.{key}", value)
+    
+    def set_flat(self, flat_key, value):
+        """Set a value in the config by its 'section.key' name"""
+        self._ensure_loaded()
+        value = str(value)
+        if self._cache.get(flat_key) == value:
+            return
+        self._cache[flat_key] = value
+        self._dirty = True
+        self._hot.pop(flat_key, None)
+        self._all_cache = None
+    
+    def cache_stats(self):
+        """Get (hits, misses, hit ratio) for the hot value cache"""
+        total = self._hits + self._misses
+        return self._hits, self._misses, (self._hits / total if total else 0.0)
     
     def save_config(self):
-        """Save the config to file"""
-        # Ensure the config directory exists
-        os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+        """Save the config to file if any setting has changed"""
+        self._ensure_loaded()
+        if not self._dirty:
+            return
+        
+        # Skip the write if the file already holds the same content
+        text = _format_ini(self._cache)
+        if text == self._file_text:
+            self._dirty = False
+            return
         
-        # Save to file
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            self.config.write(f)
+        # Ensure the config directory exists (once per process)
+        global _config_dir_ready
+        if not _config_dir_ready:
+            os.makedirs(_CONFIG_DIR, exist_ok=True)
+            _config_dir_ready = True
+        
+        # Write to a temp file and swap it in so a failed write never truncates the config
+        tmp_file = self.config_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8', buffering=65536) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.config_file)
+        self._file_text = text
+        self._dirty = False
     
-    def get_all_settings(self) -> Dict[str, Dict[str, str]]:
-        """Get all settings as a dictionary"""
-        return {section: dict(self.config[section]) for section in self.config.sections()} 
\ No newline at end of file
+    def get_all_settings(self) -> Mapping[str, Mapping[str, str]]:
+        """Get all settings as a read-only dictionary"""
+        if self._all_cache is None:
+            self._ensure_loaded()
+            settings = {}
+            for flat_key, value in self._cache.items():
+                section, _, key = flat_key.partition('.')
+                settings.setdefault(section, {})[key] = value
+            self._all_cache = MappingProxyType({s: MappingProxyType(keys) for s, keys in settings.items()})
+        return self._all_cache
+
+@functools.lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManagerEverything:
+    """Get the shared config manager instance"""
+    return ConfigManagerEverything()
@@ -1,25 +1,72 @@
 import os
 import sys
-import argparse
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 import subprocess
 import json
+import io
 from datetime import datetime
 import shutil
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from tqdm import tqdm
 import multiprocessing
-from threading import Lock
+from threading import Lock, Thread
 import csv
 import webbrowser
 import winreg
 import re
+import time
+import unicodedata
+import queue
+from collections import deque
+import ctypes
+import functools
+from dataclasses import dataclass
+from typing import Optional
 from localization.language_manager_everything import LanguageManagerEverything
-from config.config_manager_everything import ConfigManagerEverything
+from config.config_manager_everything import (
+    get_config_manager, KEY_LANGUAGE, KEY_REGEX_FILTER, KEY_ENABLE_LOGGING, KEY_MATCH_FOLDER_STRUCTURE,
+    KEY_DEFAULT_COPY_FOLDER, KEY_DEFAULT_MOVE_FOLDER
+)
 
 EVERYTHING_DOWNLOAD_URL = "https://www.voidtools.com/downloads/"
 
+# Number of plain filenames combined into one es.exe OR query
+SEARCH_BATCH_SIZE = 50
+# Number of found files sent to a worker process per task
+PROCESS_CHUNK_SIZE = 64
+# Minimum seconds between GUI progress repaints
+PROGRESS_REPAINT_INTERVAL = 0.033
+# Milliseconds between GUI log flushes and the most messages written per flush
+LOG_DRAIN_INTERVAL_MS = 50
+LOG_DRAIN_MAX_MESSAGES = 500
+# Localized strings used on the GUI's progress and error paths, resolved once per language
+GUI_HOT_STRINGS = ("progress.starting", "progress.ready", "progress.completed",
+                   "progress.search", "progress.process", "progress.delete", "errors.process_error")
+# Milliseconds to wait before writing settings changes to disk
+CONFIG_SAVE_DELAY_MS = 500
+# Milliseconds between checks for a running search to finish after the window was asked to close
+CLOSE_POLL_INTERVAL_MS = 200
+ES_SYNTAX_CHARS = set('*?:|<>"\\/')
+
+def _cache_success(succeeded):
+    """Cache a detection result for the session once it succeeds; failed detections run again next time"""
+    def decorator(func):
+        cached = []
+        
+        @functools.wraps(func)
+        def wrapper():
+            if cached:
+                return cached[0]
+            result = func()
+            if succeeded(result):
+                cached.append(result)
+            return result
+        return wrapper
+    return decorator
+
+@_cache_success(lambda path: path is not None)
 def find_everything_installation():
     """Find Everything installation directory"""
     possible_paths = [
@@ -72,6 +119,7 @@ def run_es_exe(es_path):
     except Exception:
         return False, None
 
+@_cache_success(lambda results: results['found'])
 def find_es_exe():
     """Find es.exe in various locations"""
     results = {
@@ -129,11 +177,53 @@ def find_es_exe():
     
     return results
 
+SC_MANAGER_CONNECT = 0x0001
+SERVICE_QUERY_STATUS = 0x0004
+SERVICE_RUNNING = 0x0004
+
+class SERVICE_STATUS(ctypes.Structure):
+    _fields_ = [
+        ("dwServiceType", ctypes.c_uint32),
+        ("dwCurrentState", ctypes.c_uint32),
+        ("dwControlsAccepted", ctypes.c_uint32),
+        ("dwWin32ExitCode", ctypes.c_uint32),
+        ("dwServiceSpecificExitCode", ctypes.c_uint32),
+        ("dwCheckPoint", ctypes.c_uint32),
+        ("dwWaitHint", ctypes.c_uint32),
+    ]
+
+def _service_running(name):
+    """Check if a Windows service is running by querying the Service Control Manager directly"""
+    advapi32 = ctypes.WinDLL('advapi32')
+    advapi32.OpenSCManagerW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_uint32]
+    advapi32.OpenSCManagerW.restype = ctypes.c_void_p
+    advapi32.OpenServiceW.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_uint32]
+    advapi32.OpenServiceW.restype = ctypes.c_void_p
+    advapi32.QueryServiceStatus.argtypes = [ctypes.c_void_p, ctypes.POINTER(SERVICE_STATUS)]
+    advapi32.CloseServiceHandle.argtypes = [ctypes.c_void_p]
+    
+    manager = advapi32.OpenSCManagerW(None, None, SC_MANAGER_CONNECT)
+    if not manager:
+        return False
+    try:
+        service = advapi32.OpenServiceW(manager, name, SERVICE_QUERY_STATUS)
+        if not service:
+            return False
+        try:
+            status = SERVICE_STATUS()
+            if not advapi32.QueryServiceStatus(service, ctypes.byref(status)):
+                return False
+            return status.dwCurrentState == SERVICE_RUNNING
+        finally:
+            advapi32.CloseServiceHandle(service)
+    finally:
+        advapi32.CloseServiceHandle(manager)
+
+@_cache_success(bool)
 def check_everything_service():
     """Check if Everything service is running"""
     try:
-        result = subprocess.run(['sc', 'query', 'Everything'], capture_output=True, text=True)
-        return 'RUNNING' in result.stdout
+        return _service_running('Everything')
     except Exception:
         return False
 
@@ -147,18 +237,26 @@ def check_everything_cli():
     
     return results['found']
 
+@_cache_success(lambda result: result[0])
+def check_everything_installed():
+    """Check if the Everything service is running and es.exe works (cached once it succeeds)"""
+    # Check service
+    if not check_everything_service():
+        return False, "Everything service is not running"
+        
+    # Check if es.exe exists and works
+    result = subprocess.run(['es.exe', '-get-everything-version'], capture_output=True, text=True)
+    if result.returncode != 0:
+        return False, "Everything CLI (es.exe) not found"
+    
+    return True, None
+
 def check_everything_status():
     """Check if Everything is installed, running and ready"""
     try:
-        # Check service
-        service_result = subprocess.run(['sc', 'query', 'Everything'], capture_output=True, text=True)
-        if 'RUNNING' not in service_result.stdout:
-            return False, "Everything service is not running"
-            
-        # Check if es.exe exists and works
-        result = subprocess.run(['es.exe', '-get-everything-version'], capture_output=True, text=True)
-        if result.returncode != 0:
-            return False, "Everything CLI (es.exe) not found"
+        ready, error = check_everything_installed()
+        if not ready:
+            return False, error
             
         # Check if still indexing
         result = subprocess.run(['es.exe', '-get-result-count', 'ext:'], capture_output=True, text=True)
@@ -189,36 +287,311 @@ Would you like to open the download page?"""
         webbrowser.open(EVERYTHING_DOWNLOAD_URL)
     return False
 
-def search_single_file(filename, regex_pattern=None):
-    """Search for a single file using Everything CLI"""
+class EverythingSDK:
+    """In-process Everything queries through the SDK DLL, avoiding an es.exe spawn per search"""
+    
+    DLL_NAME = "Everything64.dll" if ctypes.sizeof(ctypes.c_void_p) == 8 else "Everything32.dll"
+    PATH_BUFFER_SIZE = 32768
+    
+    def __init__(self, dll_path):
+        self.dll = ctypes.WinDLL(dll_path)
+        self.dll.Everything_SetSearchW.argtypes = [ctypes.c_wchar_p]
+        self.dll.Everything_SetSearchW.restype = None
+        self.dll.Everything_QueryW.argtypes = [ctypes.c_int]
+        self.dll.Everything_QueryW.restype = ctypes.c_int
+        self.dll.Everything_GetNumResults.restype = ctypes.c_uint32
+        self.dll.Everything_GetResultFullPathNameW.argtypes = [ctypes.c_uint32, ctypes.c_wchar_p, ctypes.c_uint32]
+        self.dll.Everything_GetResultFullPathNameW.restype = ctypes.c_uint32
+        self._buffer = ctypes.create_unicode_buffer(self.PATH_BUFFER_SIZE)
+        # The SDK keeps its query state globally, so only one search may run at a time
+        self._lock = Lock()
+    
+    @classmethod
+    def load(cls):
+        """Load the SDK DLL from the script or Everything folder, or return None"""
+        search_dirs = [os.path.dirname(os.path.abspath(__file__))]
+        install_dir = find_everything_installation()
+        if install_dir:
+            search_dirs.append(install_dir)
+        
+        for directory in search_dirs:
+            dll_path = os.path.join(directory, cls.DLL_NAME)
+            if os.path.exists(dll_path):
+                try:
+                    return cls(dll_path)
+                except (OSError, AttributeError):
+                    return None
+        return None
+    
+    def search(self, search_args):
+        """Run a search and return the full paths, or None on failure"""
+        # Quote terms the same way they would reach es.exe on the command line
+        search = ' '.join(f'"{arg}"' if ' ' in arg else arg for arg in search_args)
+        
+        with self._lock:
+            self.dll.Everything_SetSearchW(search)
+            if not self.dll.Everything_QueryW(True):
+                return None
+            
+            paths = []
+            for i in range(self.dll.Everything_GetNumResults()):
+                self.dll.Everything_GetResultFullPathNameW(i, self._buffer, self.PATH_BUFFER_SIZE)
+                paths.append(self._buffer.value)
+            return paths
+
+_everything_sdk = None
+_everything_sdk_loaded = False
+
+def get_everything_sdk():
+    """Get the process-wide Everything SDK instance, or None if the DLL is unavailable"""
+    global _everything_sdk, _everything_sdk_loaded
+    if not _everything_sdk_loaded:
+        _everything_sdk = EverythingSDK.load()
+        _everything_sdk_loaded = True
+    return _everything_sdk
+
+@functools.lru_cache(maxsize=64)
+def _compile_regex(pattern):
+    """Compile a regex filter, reusing the compiled pattern for repeated runs"""
+    return re.compile(pattern)
+
+def path_matcher(regex):
+    """Get a predicate for the regex filter, using a plain substring test for literal patterns"""
+    if regex is None:
+        return None
+    pattern = regex.pattern
+    if not regex.flags & re.IGNORECASE and re.escape(pattern) == pattern:
+        return lambda path: pattern in path
+    return regex.search
+
+def run_es_search(search_args, regex=None):
+    """Run an Everything search and return the full paths matching the regex, or None on failure"""
+    match = path_matcher(regex)
+    
+    # Query in-process when the SDK DLL is available
+    sdk = get_everything_sdk()
+    if sdk is not None:
+        paths = sdk.search(search_args)
+        if paths is not None:
+            return paths if match is None else [path for path in paths if match(path)]
+    
+    # Otherwise fall back to es.exe, streaming UTF-8 CSV rows from the pipe and filtering as they arrive
+    cmd = ['es.exe', '-cp', '65001', '-csv', '-no-header', '-full-path-and-name'] + search_args
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1024 * 1024) as proc:
+        stream = io.TextIOWrapper(proc.stdout, encoding='utf-8', newline='')
+        paths = [row[0] for row in csv.reader(stream)
+                 if row and row[0] and (match is None or match(row[0]))]
+    if proc.returncode != 0:
+        return None
+    return paths
+
+def search_single_file(filename, regex=None):
+    """Search for a single file using Everything CLI, filtering paths with a compiled regex"""
     try:
         # Use the filename as is, without forcing any extension
         search_term = filename
         
-        # Use -full-path-and-name to get absolute paths
-        cmd = ['es.exe', '-full-path-and-name', search_term]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        paths = run_es_search([search_term], regex)
         
-        if result.returncode == 0:
-            paths = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-            
-            # Apply regex filter if provided
-            if regex_pattern:
-                try:
-                    regex = re.compile(regex_pattern)
-                    paths = [path for path in paths if regex.search(path)]
-                except re.error:
-                    return []
-            
+        if paths is not None:
             return [(filename, path) for path in paths]
         return []
     except Exception:
         return []
 
+def _is_plain_term(filename):
+    """Check if a filename has no Everything search syntax and can be OR-combined"""
+    return bool(filename) and filename[0] not in '-!' and not any(c in ES_SYNTAX_CHARS for c in filename)
+
+def _fold_name(text):
+    """Lowercase text and strip diacritics, as Everything ignores them when matching by default"""
+    if text.isascii():
+        return text.lower()
+    return ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c)).lower()
+
+def search_batch(filenames, regex=None):
+    """Search for several plain filenames with a single Everything CLI call"""
+    if len(filenames) == 1:
+        return search_single_file(filenames[0], regex)
+    
+    try:
+        # OR the terms together; each term stays a separate argument so names with spaces are quoted
+        search_args = []
+        for i, filename in enumerate(filenames):
+            if i:
+                search_args.append('|')
+            search_args.append(filename)
+        
+        paths = run_es_search(search_args, regex)
+        if paths is None:
+            return []
+        
+        # Map each result back to the search term(s) whose name it matches
+        terms = {}
+        for filename in filenames:
+            terms.setdefault(_fold_name(filename), []).append(filename)
+        results = []
+        for path in paths:
+            name = _fold_name(os.path.basename(path))
+            matched = False
+            for term, originals in terms.items():
+                if term in name:
+                    results.extend((filename, path) for filename in originals)
+                    matched = True
+            if not matched:
+                # Everything matched this path in a way the basename test can't attribute to a term,
+                # so give up on the batch and search each term on its own
+                results = []
+                for filename in filenames:
+                    results.extend(search_single_file(filename, regex))
+                return results
+        return results
+    except Exception:
+        return []
+
+def scan_for_names(roots, filenames):
+    """Find files with exactly the given names under the root folders without using Everything"""
+    wanted = {}
+    for filename in filenames:
+        wanted.setdefault(filename.lower(), []).append(filename)
+    
+    results = []
+    pending = list(roots)
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.lower() in wanted:
+                            results.extend((filename, entry.path) for filename in wanted[entry.name.lower()])
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return results
+
+MOVEFILE_REPLACE_EXISTING = 0x1
+MOVEFILE_COPY_ALLOWED = 0x2
+MOVEFILE_WRITE_THROUGH = 0x8
+
+try:
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.CopyFileExW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p,
+                                      ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+    _kernel32.CopyFileExW.restype = ctypes.c_int
+    _kernel32.MoveFileExW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_uint32]
+    _kernel32.MoveFileExW.restype = ctypes.c_int
+except (AttributeError, OSError):
+    _kernel32 = None
+
+def _copy_file(source, dest):
+    """Copy a file in the kernel with CopyFileExW, falling back to shutil.copy2"""
+    if _kernel32 is None:
+        shutil.copy2(source, dest)
+        return
+    if os.path.isdir(dest):
+        dest = os.path.join(dest, os.path.basename(source))
+    if not _kernel32.CopyFileExW(source, dest, None, None, None, 0):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+def _move_file(source, dest):
+    """Move a file with MoveFileExW (copying across drives), falling back to shutil.move"""
+    # MoveFileExW can't move folders across drives, so leave folder hits to shutil.move
+    if _kernel32 is None or os.path.isdir(source):
+        shutil.move(source, dest)
+        return
+    if os.path.isdir(dest):
+        dest = os.path.join(dest, os.path.basename(source))
+    flags = MOVEFILE_REPLACE_EXISTING | MOVEFILE_COPY_ALLOWED | MOVEFILE_WRITE_THROUGH
+    if not _kernel32.MoveFileExW(source, dest, flags):
+        raise ctypes.WinError(ctypes.get_last_error())
+    # A cross-drive move reports success even if deleting the source after copying failed
+    if os.path.lexists(source):
+        raise OSError(f"Copied to {dest} but could not remove the source file")
+
+@dataclass(frozen=True)
+class _ProcessConfig:
+    """Settings needed by worker processes to copy, move or delete a file"""
+    copy_path: Optional[str]
+    move_path: Optional[str]
+    delete_mode: bool
+    match_folder_structure: bool
+    # Destination folders with a trailing separator, for joining relative paths by concatenation
+    copy_prefix: Optional[str] = None
+    move_prefix: Optional[str] = None
+
+_DRIVE_SUFFIX = ':' + os.sep
+
+def _dest_prefix(path):
+    """Get a destination folder with exactly one trailing separator"""
+    return path.rstrip('\\/') + os.sep if path else None
+
+def _relative_source(source_path):
+    """Get a source path without its drive or leading separators"""
+    # Everything reports absolute 'X:\' paths, so slicing covers the common case without splitdrive
+    if source_path[1:3] == _DRIVE_SUFFIX:
+        return source_path[3:]
+    return os.path.splitdrive(source_path)[1].lstrip(os.sep)
+
+def _process_one(cfg, file_info):
+    """Copy, move or delete a single found file; returns an error message on failure
+    
+    Destination folders for structured copies/moves must already exist (see _create_dest_dirs).
+    """
+    filename, source_path = file_info
+    
+    try:
+        if cfg.delete_mode:
+            os.remove(source_path)
+            return None
+        
+        rel_path = _relative_source(source_path) if cfg.match_folder_structure else None
+        
+        if cfg.copy_path:
+            if rel_path is not None:
+                dest_dir = cfg.copy_prefix + rel_path
+                _copy_file(source_path, dest_dir)
+            else:
+                dest = os.path.join(cfg.copy_path, filename)
+                _copy_file(source_path, dest)
+        
+        if cfg.move_path:
+            if rel_path is not None:
+                dest_dir = cfg.move_prefix + rel_path
+                _move_file(source_path, dest_dir)
+            else:
+                dest = os.path.join(cfg.move_path, filename)
+                _move_file(source_path, dest)
+        
+        return None
+    except Exception as e:
+        return f"Error processing {source_path}: {str(e)}"
+
+_process_pool = None
+
+def get_process_pool():
+    """Get the process-wide worker pool, creating it on first use and reusing it for later runs"""
+    global _process_pool
+    # A pool whose worker died rejects all further work, so replace it
+    if _process_pool is not None and getattr(_process_pool, '_broken', False):
+        reset_process_pool()
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=max(1, multiprocessing.cpu_count() - 1))
+    return _process_pool
+
+def reset_process_pool():
+    """Discard the process-wide worker pool so the next run starts a fresh one"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False)
+        _process_pool = None
+
 class EverythingSearcher:
     def __init__(self, input_file=None, input_text=None, copy_path=None, move_path=None, log_path=None, 
                  match_folder_structure=True, delete_mode=False, log_callback=None, progress_callback=None,
-                 regex_filter=None, lang=None):
+                 regex_filter=None, lang=None, search_roots=None):
         self.input_file = input_file
         self.input_text = input_text
         self.copy_path = copy_path
@@ -227,6 +600,7 @@ class EverythingSearcher:
         self.match_folder_structure = match_folder_structure
         self.delete_mode = delete_mode
         self.regex_filter = regex_filter
+        self.search_roots = search_roots
         self.lang = lang  # Store language manager
         
         # Store callbacks but don't pickle them
@@ -245,17 +619,42 @@ class EverythingSearcher:
             os.makedirs(self.copy_path, exist_ok=True)
         if self.move_path:
             os.makedirs(self.move_path, exist_ok=True)
+        
+        # Open one log file for the whole run instead of reopening it per message
+        self._log_file = None
+        self._log_fh = None
+        self._log_lock = Lock()
+        if self.log_path:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self._log_file = os.path.join(self.log_path, f"log_{timestamp}.txt")
+            self._log_fh = open(self._log_file, 'a', encoding='utf-8', buffering=1 << 16)
     
     def __getstate__(self):
-        """Remove callbacks when pickling"""
+        """Remove callbacks and the log handle when pickling"""
         state = self.__dict__.copy()
         state['_log_callback'] = None
         state['_progress_callback'] = None
+        state['_log_fh'] = None
+        state['_log_lock'] = None
         return state
     
     def __setstate__(self, state):
         """Restore state after unpickling"""
         self.__dict__.update(state)
+        self._log_lock = Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the log file"""
+        with self._log_lock:
+            if self._log_fh is not None:
+                self._log_fh.close()
+                self._log_fh = None
 
     def log(self, message):
         """Log a message"""
@@ -265,11 +664,15 @@ class EverythingSearcher:
                 self._log_callback(message)
             except Exception as e:
                 print(f"Error in log callback: {str(e)}")
-        if self.log_path:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_file = os.path.join(self.log_path, f"log_{timestamp}.txt")
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(f"{datetime.now().isoformat()}: {message}\n")
+        if self._log_file:
+            line = f"{datetime.now().isoformat()}: {message}\n"
+            with self._log_lock:
+                if self._log_fh is not None:
+                    self._log_fh.write(line)
+                    return
+            # A closed searcher appends to the run's log file directly
+            with open(self._log_file, 'a', encoding='utf-8') as f:
+                f.write(line)
 
     def update_progress(self, phase, current, total):
         """Update progress through callback if set"""
@@ -294,44 +697,67 @@ class EverythingSearcher:
             self.log(f"Error reading input file: {str(e)}")
             return []
 
-    def process_file(self, file_info):
-        """Process a single found file"""
-        filename, source_path = file_info
+    def _process_config(self):
+        """Get the small picklable settings sent to worker processes"""
+        return _ProcessConfig(self.copy_path, self.move_path, self.delete_mode, self.match_folder_structure,
+                              _dest_prefix(self.copy_path), _dest_prefix(self.move_path))
+    
+    def _create_dest_dirs(self, cfg, file_infos):
+        """Create every destination folder once per run, before files are handed to workers"""
+        if cfg.delete_mode or not cfg.match_folder_structure:
+            return
         
-        try:
-            if self.delete_mode:
-                os.remove(source_path)
-                return True
-            
-            if self.copy_path:
-                if self.match_folder_structure:
-                    rel_path = os.path.splitdrive(source_path)[1].lstrip(os.sep)
-                    dest_dir = os.path.join(self.copy_path, rel_path)
-                    os.makedirs(os.path.dirname(dest_dir), exist_ok=True)
-                    shutil.copy2(source_path, dest_dir)
-                else:
-                    dest = os.path.join(self.copy_path, filename)
-                    shutil.copy2(source_path, dest)
-            
-            if self.move_path:
-                if self.match_folder_structure:
-                    rel_path = os.path.splitdrive(source_path)[1].lstrip(os.sep)
-                    dest_dir = os.path.join(self.move_path, rel_path)
-                    os.makedirs(os.path.dirname(dest_dir), exist_ok=True)
-                    shutil.move(source_path, dest_dir)
-                else:
-                    dest = os.path.join(self.move_path, filename)
-                    shutil.move(source_path, dest)
-            
-            return True
-        except Exception as e:
-            self.log(f"Error processing {source_path}: {str(e)}")
-            return False
+        dirs = set()
+        for _, source_path in file_infos:
+            rel_path = _relative_source(source_path)
+            for prefix in (cfg.copy_prefix, cfg.move_prefix):
+                if prefix:
+                    dirs.add(os.path.dirname(prefix + rel_path))
+        
+        for directory in sorted(dirs, key=len):
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError:
+                # The copy/move of the affected files will fail and report the error
+                pass
+    
+    def _run_process_phase(self, phase, desc):
+        """Process all found files in the worker pool, sending them in chunks"""
+        cfg = self._process_config()
+        self._create_dest_dirs(cfg, self.found_files)
+        
+        worker = functools.partial(_process_one, cfg)
+        total = len(self.found_files)
+        done = 0
+        with tqdm(total=total, desc=desc, unit="file") as pbar:
+            # If a worker dies, retry the files without a result once on a fresh pool
+            for _ in range(2):
+                pending = self.found_files[done:]
+                try:
+                    results = get_process_pool().map(worker, pending, chunksize=PROCESS_CHUNK_SIZE)
+                    for file_info, error in zip(pending, results):
+                        if error:
+                            self.log(error)
+                            self.failed_files.append(file_info)
+                        else:
+                            self.processed_files.append(file_info)
+                        done += 1
+                        pbar.update(1)
+                        self.update_progress(phase, done, total)
+                    return
+                except BrokenProcessPool as e:
+                    reset_process_pool()
+                    pool_error = e
+        
+        # The pool broke twice; report the remaining files as failed
+        for file_info in self.found_files[done:]:
+            self.log(f"Error processing {file_info[1]}: {str(pool_error)}")
+            self.failed_files.append(file_info)
 
     def process_files(self):
         """Main processing function"""
-        # Read input files
-        filenames = self.read_input_file()
+        # Read input files, dropping repeats so each is only searched once
+        filenames = list(dict.fromkeys(self.read_input_file()))
         if not filenames:
             self.log(self.lang.get_string("messages.no_files"))
             return
@@ -341,10 +767,11 @@ class EverythingSearcher:
         for filename in filenames:
             self.log(f"- {filename}")
         
-        # Validate regex pattern if provided
+        # Validate and compile the regex pattern once if provided
+        regex = None
         if self.regex_filter:
             try:
-                re.compile(self.regex_filter)
+                regex = _compile_regex(self.regex_filter)
             except re.error as e:
                 self.log(self.lang.get_string("errors.invalid_regex").format(str(e)))
                 return
@@ -352,21 +779,36 @@ class EverythingSearcher:
         # Search for files
         total_files = len(filenames)
         processed_files = 0
-        found_count = 0
         
-        # Search for files
-        with ProcessPoolExecutor(max_workers=max(1, multiprocessing.cpu_count() - 1)) as executor:
-            search_futures = [executor.submit(search_single_file, filename, self.regex_filter) 
-                            for filename in filenames]
+        if self.search_roots and regex is None and all(_is_plain_term(filename) for filename in filenames):
+            # Exact names under known folders can be found with a directory walk, without Everything
+            self.found_files = scan_for_names(self.search_roots, filenames)
+            self.update_progress("search", total_files, total_files)
+        else:
+            # Group plain filenames into OR queries; names using search syntax are run on their own
+            plain = [filename for filename in filenames if _is_plain_term(filename)]
+            batches = [plain[i:i + SEARCH_BATCH_SIZE] for i in range(0, len(plain), SEARCH_BATCH_SIZE)]
+            batches.extend([filename] for filename in filenames if not _is_plain_term(filename))
             
-            for future in tqdm(as_completed(search_futures), total=len(search_futures),
-                             desc="Searching files", unit="file"):
-                processed_files += 1
-                results = future.result()
-                if results:
-                    found_count += len(results)
-                    self.found_files.extend(results)
-                self.update_progress("search", processed_files, total_files)
+            # Search for files; searches mostly wait on Everything, so threads avoid process spawn and pickling
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                search_futures = {executor.submit(search_batch, batch, regex): batch
+                                  for batch in batches}
+                
+                with tqdm(total=total_files, desc="Searching files", unit="file") as pbar:
+                    for future in as_completed(search_futures):
+                        batch_size = len(search_futures[future])
+                        processed_files += batch_size
+                        pbar.update(batch_size)
+                        self.found_files.extend(future.result())
+                        self.update_progress("search", processed_files, total_files)
+        
+        # Overlapping terms (e.g. "report" and "report.pdf") can find the same file; process each path once
+        unique_paths = {}
+        for file_info in self.found_files:
+            unique_paths.setdefault(file_info[1], file_info)
+        self.found_files = list(unique_paths.values())
+        found_count = len(self.found_files)
         
         # Show found files
         if self.found_files:
@@ -381,34 +823,10 @@ class EverythingSearcher:
         if self.found_files:
             if self.delete_mode:
                 # If delete mode is enabled, only delete files
-                with ProcessPoolExecutor(max_workers=max(1, multiprocessing.cpu_count() - 1)) as executor:
-                    process_futures = [executor.submit(self.process_file, file_info) 
-                                     for file_info in self.found_files]
-                    
-                    processed_count = 0
-                    for future in tqdm(as_completed(process_futures), total=len(process_futures),
-                                     desc="Deleting files", unit="file"):
-                        processed_count += 1
-                        if future.result():
-                            self.processed_files.append(self.found_files[processed_count - 1])
-                        else:
-                            self.failed_files.append(self.found_files[processed_count - 1])
-                        self.update_progress("delete", processed_count, len(self.found_files))
+                self._run_process_phase("delete", "Deleting files")
             elif self.copy_path or self.move_path:
                 # Only copy/move if delete mode is not enabled
-                with ProcessPoolExecutor(max_workers=max(1, multiprocessing.cpu_count() - 1)) as executor:
-                    process_futures = [executor.submit(self.process_file, file_info) 
-                                     for file_info in self.found_files]
-                    
-                    processed_count = 0
-                    for future in tqdm(as_completed(process_futures), total=len(process_futures),
-                                     desc="Processing files", unit="file"):
-                        processed_count += 1
-                        if future.result():
-                            self.processed_files.append(self.found_files[processed_count - 1])
-                        else:
-                            self.failed_files.append(self.found_files[processed_count - 1])
-                        self.update_progress("process", processed_count, len(self.found_files))
+                self._run_process_phase("process", "Processing files")
         
         # Output summary
         self.log("\n" + self.lang.get_string("messages.summary"))
@@ -434,14 +852,25 @@ class EverythingSearcher:
 class SearchGUI:
     def __init__(self):
         self.root = tk.Tk()
+        self._last_progress_time = 0.0
+        self._log_queue = queue.Queue()
+        self._ui_calls = queue.Queue()  # Callables run on the Tk thread on behalf of the search thread
+        self._pending_progress = None
+        self._cached_widgets = None  # Widget tree below main_frame, collected on first language change
+        self._tooltip_win = None  # One tooltip window reused for every widget
+        self._tooltip_label = None
+        self._tooltip_owner = None  # Widget the tooltip is currently shown for, None while hidden
+        self._save_handle = None  # Pending debounced config save
+        self._input_state = None  # Cached (is_default, is_empty) for the input box, None when stale
+        self._search_thread = None  # Background thread running the current search, if any
+        self._close_pending = False  # Set when the window should close once the search finishes
         
         # Initialize config manager
-        self.config = ConfigManagerEverything()
+        self.config = get_config_manager()
         
         # Initialize language manager
-        initial_language = self.config.get("Interface", "language", "English")
+        initial_language = self.config.get_flat(KEY_LANGUAGE, "English")
         self.lang = LanguageManagerEverything(initial_language)
-        self._initial_language = initial_language  # Store initial language
         
         # Verify language loading
         if not self.lang.current_language:
@@ -452,6 +881,9 @@ class SearchGUI:
                 print("Failed to load English language!")
                 self.root.destroy()
                 return
+        self._active_language = self.lang.current_language
+        self._strs = {}
+        self._cache_hot_strings()
         
         self.root.title(self.lang.get_string("window.title"))
         self.root.geometry("800x800")
@@ -479,6 +911,9 @@ class SearchGUI:
         
         # Save settings on window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
+        
+        # Start applying queued log messages and updates from the search thread
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
     
     def create_menu_bar(self):
         """Create the menu bar"""
@@ -552,6 +987,7 @@ class SearchGUI:
         self.input_text.normal_color = self.input_text.cget("fg")
         self.input_text.bind('<FocusIn>', self.on_input_focus_in)
         self.input_text.bind('<FocusOut>', self.on_input_focus_out)
+        self.input_text.bind('<<Modified>>', self._on_input_modified)
         
         # Set initial state
         self.on_input_focus_out(None)
@@ -594,7 +1030,7 @@ class SearchGUI:
         copy_label.grid(row=1, column=0, sticky=tk.W, pady=2)
         self._add_tooltip(copy_label, "copy_to")
         
-        self.copy_path = tk.StringVar(value=self.config.get("Paths", "default_copy_folder", ""))
+        self.copy_path = tk.StringVar(value=self.config.get_flat(KEY_DEFAULT_COPY_FOLDER, ""))
         copy_entry = ttk.Entry(options_frame, textvariable=self.copy_path)
         copy_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 0))
         
@@ -608,7 +1044,7 @@ class SearchGUI:
         move_label.grid(row=2, column=0, sticky=tk.W, pady=2)
         self._add_tooltip(move_label, "move_to")
         
-        self.move_path = tk.StringVar(value=self.config.get("Paths", "default_move_folder", ""))
+        self.move_path = tk.StringVar(value=self.config.get_flat(KEY_DEFAULT_MOVE_FOLDER, ""))
         move_entry = ttk.Entry(options_frame, textvariable=self.move_path)
         move_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(5, 0))
         
@@ -657,19 +1093,54 @@ class SearchGUI:
         self.main_frame.rowconfigure(6, weight=1)  # Make log output expandable
 
     def update_progress(self, phase, current, total):
-        """Update progress bar and label"""
+        """Update progress bar and label, repainting at most once per frame"""
+        now = time.monotonic()
+        if current < total and now - self._last_progress_time < PROGRESS_REPAINT_INTERVAL:
+            return
+        self._last_progress_time = now
+        
         if total > 0:
             progress = (current / total) * 100
             self.progress_var.set(progress)
-            phase_text = self.lang.get_string(f"progress.{phase}")
+            key = f"progress.{phase}"
+            phase_text = self._strs.get(key) or self.lang.get_string(key)
             self.progress_label.config(text=f"{phase_text}: {current}/{total} ({progress:.1f}%)")
+        self._flush_log()
         self.root.update_idletasks()
 
-    def log_output(self, message):
-        """Log a message to the output text area"""
-        self.log_output.insert(tk.END, message + "\n")
-        self.log_output.see(tk.END)
-        self.root.update_idletasks()
+    def log(self, message):
+        """Queue a message for the output text area (safe to call from any thread)"""
+        self._log_queue.put(message + "\n")
+
+    def _flush_log(self):
+        """Write queued log messages to the output area in a single insert"""
+        batch = []
+        try:
+            while len(batch) < LOG_DRAIN_MAX_MESSAGES:
+                batch.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if batch:
+            self.log_output.insert(tk.END, ''.join(batch))
+            self.log_output.see(tk.END)
+    
+    def _drain_log(self):
+        """Periodically apply progress, log messages and UI calls queued by the search thread"""
+        progress = self._pending_progress
+        if progress is not None:
+            self._pending_progress = None
+            self.update_progress(*progress)
+        self._flush_log()
+        try:
+            while True:
+                self._ui_calls.get_nowait()()
+        except queue.Empty:
+            pass
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
+    
+    def _queue_progress(self, phase, current, total):
+        """Record progress from the search thread; only the latest value is shown"""
+        self._pending_progress = (phase, current, total)
 
     def start_processing(self):
         """Start the processing operation"""
@@ -689,9 +1160,10 @@ class SearchGUI:
         
         # Validate regex pattern if provided
         regex_pattern = self.regex_filter.get().strip()
+        regex = None
         if regex_pattern:
             try:
-                re.compile(regex_pattern)
+                regex = _compile_regex(regex_pattern)
             except re.error as e:
                 messagebox.showerror("Error", self.lang.get_string("errors.invalid_regex").format(str(e)))
                 return
@@ -699,7 +1171,7 @@ class SearchGUI:
         # Disable process button
         self.process_button.state(['disabled'])
         self.progress_var.set(0)
-        self.progress_label.config(text=self.lang.get_string("progress.starting"))
+        self.progress_label.config(text=self._strs["progress.starting"])
         
         try:
             # Process filenames
@@ -713,26 +1185,45 @@ class SearchGUI:
                 log_path="logs" if self.log_enabled.get() else None,
                 match_folder_structure=self.match_folder_structure.get(),
                 delete_mode=self.delete_mode.get(),
-                log_callback=lambda msg: self.log_output.insert(tk.END, msg + "\n"),
-                progress_callback=self.update_progress,
-                regex_filter=regex_pattern if regex_pattern else None,
+                log_callback=self.log,
+                progress_callback=self._queue_progress,
+                regex_filter=regex,
                 lang=self.lang  # Pass the language manager
             )
             
             # Clear output
             self.log_output.delete('1.0', tk.END)
-            
-            # Process files
-            searcher.process_files()
-            self.log_output.insert(tk.END, "\n" + self.lang.get_string("progress.completed"))
-            
         except Exception as e:
-            messagebox.showerror("Error", self.lang.get_string("errors.process_error").format(str(e)))
-            self.log_output.insert(tk.END, f"\n{self.lang.get_string('errors.process_error').format(str(e))}")
+            self._show_process_error(e)
+            self._finish_processing()
+            return
+        
+        # Process files in the background so the window stays responsive
+        self._search_thread = Thread(target=self._run_search, args=(searcher,), daemon=True)
+        self._search_thread.start()
+
+    def _run_search(self, searcher):
+        """Run the searcher on a worker thread, handing UI work back to the main thread"""
+        try:
+            with searcher:
+                searcher.process_files()
+            self.log("\n" + self._strs["progress.completed"])
+        except Exception as e:
+            self._ui_calls.put(functools.partial(self._show_process_error, e))
         finally:
-            # Re-enable process button
-            self.process_button.state(['!disabled'])
-            self.progress_label.config(text=self.lang.get_string("progress.ready"))
+            self._ui_calls.put(self._finish_processing)
+
+    def _show_process_error(self, error):
+        """Report a processing error in a dialog and the output area"""
+        message = self._strs["errors.process_error"].format(str(error))
+        messagebox.showerror("Error", message)
+        self.log(f"\n{message}")
+
+    def _finish_processing(self):
+        """Reset the controls after processing ends"""
+        # Re-enable process button
+        self.process_button.state(['!disabled'])
+        self.progress_label.config(text=self._strs["progress.ready"])
 
     def browse_output(self, output_type):
         """Browse for output directory"""
@@ -757,17 +1248,29 @@ class SearchGUI:
         self.progress_var.set(0)
         self.progress_label.config(text="Ready")
 
+    def _on_input_modified(self, event):
+        """Mark the cached input state stale after the text changes"""
+        self._input_state = None
+        self.input_text.edit_modified(False)
+
+    def _get_input_state(self):
+        """Get whether the input box shows the default text and whether it is empty"""
+        if self._input_state is None:
+            current_text = self.input_text.get('1.0', 'end-1c').strip()
+            self._input_state = (current_text == self.input_text.default_text, not current_text)
+        return self._input_state
+
     def on_input_focus_in(self, event):
         """Handle input focus in event"""
-        current_text = self.input_text.get('1.0', 'end-1c').strip()
-        if current_text == self.input_text.default_text:
+        is_default, _ = self._get_input_state()
+        if is_default:
             self.input_text.delete('1.0', tk.END)
             self.input_text.configure(fg=self.input_text.normal_color)
 
     def on_input_focus_out(self, event):
         """Handle input focus out event"""
-        current_text = self.input_text.get('1.0', 'end-1c').strip()
-        if not current_text:
+        _, is_empty = self._get_input_state()
+        if is_empty:
             self.input_text.delete('1.0', tk.END)
             self.input_text.configure(fg=self.input_text.default_color)
             self.input_text.insert('1.0', self.input_text.default_text)
@@ -784,57 +1287,84 @@ class SearchGUI:
             widget.tooltip = tooltip_text  # Store current tooltip text
             
             def show_tooltip(event):
-                if hasattr(widget, 'tooltip_window'):
-                    widget.tooltip_window.destroy()
-                tooltip = tk.Toplevel()
-                tooltip.wm_overrideredirect(True)
+                # Resolve the text on first hover after a language change
+                text = widget.tooltip
+                if text is None:
+                    text = widget.tooltip = self.lang.get_tooltip(key)
+                if not text:
+                    return
+                tooltip = self._get_tooltip_window()
+                self._tooltip_label.config(text=text)
                 tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-                
-                # Use current tooltip text from widget
-                label = ttk.Label(tooltip, text=widget.tooltip, justify='left',
-                                relief='solid', borderwidth=1)
-                label.pack()
-                
-                widget.tooltip_window = tooltip
+                tooltip.deiconify()
+                self._tooltip_owner = widget
             
             def hide_tooltip(event):
-                if hasattr(widget, 'tooltip_window'):
-                    widget.tooltip_window.destroy()
-                    delattr(widget, 'tooltip_window')
+                if self._tooltip_owner is widget:
+                    self._tooltip_win.withdraw()
+                    self._tooltip_owner = None
             
             widget.bind('<Enter>', show_tooltip)
             widget.bind('<Leave>', hide_tooltip)
 
-    def _get_language_name(self, lang_code):
-        """Get the display name for a language code"""
-        self.lang.set_language(lang_code)
-        name = self.lang.get_string("language.name")
-        self.lang.set_language(self._initial_language)
-        return name
+    def _get_tooltip_window(self):
+        """Get the shared tooltip window, creating it hidden on first use"""
+        if self._tooltip_win is None:
+            self._tooltip_win = tk.Toplevel(self.root)
+            self._tooltip_win.wm_overrideredirect(True)
+            self._tooltip_win.withdraw()
+            self._tooltip_label = ttk.Label(self._tooltip_win, justify='left',
+                                            relief='solid', borderwidth=1)
+            self._tooltip_label.pack()
+        return self._tooltip_win
 
     def _on_language_change(self, event=None):
         """Handle language change event"""
         # Get the selected language
         selected_language = self.current_language.get()
+        if selected_language == self._active_language:
+            return
         
         # Update language manager
         if self.lang.set_language(selected_language):
+            self._active_language = selected_language
+            
             # Update all GUI strings
             self._update_gui_strings()
             
             # Save the selected language in config
-            self.config.set("Interface", "language", selected_language)
-            self.config.save_config()
+            self.config.set_flat(KEY_LANGUAGE, selected_language)
+            self._schedule_save_config()
+
+    def _schedule_save_config(self):
+        """Save the config shortly, restarting the delay if a save is already pending"""
+        if self._save_handle is not None:
+            self.root.after_cancel(self._save_handle)
+        self._save_handle = self.root.after(CONFIG_SAVE_DELAY_MS, self._do_save_config)
+
+    def _do_save_config(self):
+        """Write a pending config save"""
+        self._save_handle = None
+        self.config.save_config()
 
     def _get_all_widgets(self, widget):
-        """Recursively get all child widgets"""
-        widgets = [widget]
-        for child in widget.winfo_children():
-            widgets.extend(self._get_all_widgets(child))
+        """Get a widget and all of its descendants, breadth first"""
+        widgets = []
+        pending = deque([widget])
+        while pending:
+            current = pending.popleft()
+            widgets.append(current)
+            pending.extend(current.winfo_children())
         return widgets
 
+    def _cache_hot_strings(self):
+        """Resolve the strings used on progress and error paths for the current language"""
+        self._strs = {key: self.lang.get_string(key) for key in GUI_HOT_STRINGS}
+
     def _update_gui_strings(self):
         """Update all GUI strings after language change"""
+        self._cache_hot_strings()
+        
         # Update window title
         self.root.title(self.lang.get_string("window.title"))
         
@@ -851,50 +1381,41 @@ class SearchGUI:
         
         def update_widget_text(widget):
             """Update text for a single widget based on its string key"""
-            if hasattr(widget, 'string_key'):
-                new_text = self.lang.get_string(widget.string_key)
-                if isinstance(widget, (ttk.Label, ttk.Button, ttk.Checkbutton, ttk.LabelFrame)):
+            new_text = self.lang.get_string(widget.string_key)
+            if isinstance(widget, (ttk.Label, ttk.Button, ttk.Checkbutton, ttk.LabelFrame)):
+                # Skip no-op configs, which would still schedule a redraw
+                last_text = getattr(widget, 'last_text', None)
+                if last_text is None:
+                    last_text = str(widget.cget('text'))
+                if last_text != new_text:
                     widget.config(text=new_text)
-                elif isinstance(widget, scrolledtext.ScrolledText):
-                    current_text = widget.get('1.0', 'end-1c').strip()
-                    # Only update if it's showing the default text
-                    if not current_text or current_text == widget.default_text:
-                        widget.delete('1.0', tk.END)
-                        widget.default_text = new_text  # Update the stored default text
-                        if not widget.focus_get() == widget:  # Only show placeholder if not focused
-                            widget.configure(fg=widget.default_color)
-                            widget.insert('1.0', new_text)
-                        else:
-                            widget.configure(fg=widget.normal_color)
-        
-        def update_container_widgets(container):
-            """Recursively update all widgets in a container"""
-            for widget in container.winfo_children():
+                widget.last_text = new_text
+            elif isinstance(widget, scrolledtext.ScrolledText):
+                current_text = widget.get('1.0', 'end-1c').strip()
+                # Nothing to do if the placeholder is already showing the new text
+                if current_text == widget.default_text == new_text:
+                    return
+                # Only update if it's showing the default text
+                if not current_text or current_text == widget.default_text:
+                    widget.delete('1.0', tk.END)
+                    widget.default_text = new_text  # Update the stored default text
+                    if not widget.focus_get() == widget:  # Only show placeholder if not focused
+                        widget.configure(fg=widget.default_color)
+                        widget.insert('1.0', new_text)
+                    else:
+                        widget.configure(fg=widget.normal_color)
+        
+        # Update text and reset tooltips of all widgets in a single pass over the cached widget list
+        if self._cached_widgets is None:
+            self._cached_widgets = self._get_all_widgets(self.main_frame)
+        for widget in self._cached_widgets:
+            if hasattr(widget, 'string_key'):
                 update_widget_text(widget)
-                if widget.winfo_children():
-                    update_container_widgets(widget)
-        
-        # Update all widgets starting from main frame
-        update_container_widgets(self.main_frame)
-        
-        # Update tooltips
-        self._update_tooltips()
-
-    def _update_tooltips(self):
-        """Update all tooltips after language change"""
-        def update_container_tooltips(container):
-            for widget in container.winfo_children():
-                if hasattr(widget, 'tooltip_key'):
-                    tooltip_text = self.lang.get_tooltip(widget.tooltip_key)
-                    if tooltip_text:
-                        widget.tooltip = tooltip_text
-                
-                # Recursively update tooltips in child containers
-                if isinstance(widget, (ttk.Frame, ttk.LabelFrame)):
-                    update_container_tooltips(widget)
+            if hasattr(widget, 'tooltip_key'):
+                widget.tooltip = None  # Resolved again on next hover
         
-        # Update all tooltips starting from main frame
-        update_container_tooltips(self.main_frame)
+        # Let Tk redraw once after all widgets are updated
+        self.root.update_idletasks()
 
     def _confirm_action(self, action_type):
         """Show confirmation dialog for dangerous actions"""
@@ -913,46 +1434,87 @@ class SearchGUI:
     def _load_settings(self):
         """Load settings from config"""
         # Load language
-        language = self.config.get("Interface", "language", "English")
+        language = self.config.get_flat(KEY_LANGUAGE, "English")
         if language in self.lang.get_languages():
             self.current_language.set(language)
             self.lang.set_language(language)
         
         # Load search settings
-        self.regex_filter.set(self.config.get("Search", "regex_filter", ""))
+        self.regex_filter.set(self.config.get_flat(KEY_REGEX_FILTER, ""))
         
         # Load output settings
-        self.log_enabled.set(self.config.get_bool("Output", "enable_logging", False))
-        self.match_folder_structure.set(self.config.get_bool("Output", "match_folder_structure", True))
+        self.log_enabled.set(self.config.get_bool_flat(KEY_ENABLE_LOGGING, False))
+        self.match_folder_structure.set(self.config.get_bool_flat(KEY_MATCH_FOLDER_STRUCTURE, True))
         
         # Load paths
-        self.copy_path.set(self.config.get("Paths", "default_copy_folder", ""))
-        self.move_path.set(self.config.get("Paths", "default_move_folder", ""))
+        self.copy_path.set(self.config.get_flat(KEY_DEFAULT_COPY_FOLDER, ""))
+        self.move_path.set(self.config.get_flat(KEY_DEFAULT_MOVE_FOLDER, ""))
         
         # Always set delete mode to False for safety
         self.delete_mode.set(False)
 
     def _on_closing(self):
         """Save settings before closing"""
+        if self._close_pending:
+            return
+        
+        # Let a running search finish so queued file operations complete and its log is flushed
+        if self._search_thread is not None and self._search_thread.is_alive():
+            if not messagebox.askyesno(
+                self.lang.get_string("confirmations.close_running_title"),
+                self.lang.get_string("confirmations.close_running_message")
+            ):
+                return
+            self._close_pending = True
+            self._disable_input()
+            self.root.after(CLOSE_POLL_INTERVAL_MS, self._close_when_finished)
+            return
+        
+        self._save_and_close()
+
+    def _disable_input(self):
+        """Disable the form and language menu while waiting to close"""
+        for widget in self._get_all_widgets(self.main_frame):
+            if isinstance(widget, (ttk.Button, ttk.Checkbutton, ttk.Entry)):
+                widget.state(['disabled'])
+        # The log output stays enabled so queued messages can still be written
+        self.input_text.configure(state='disabled')
+        for i in range(self.menubar.index("end") + 1):
+            if self.menubar.type(i) == "cascade":
+                self.menubar.entryconfigure(i, state='disabled')
+
+    def _close_when_finished(self):
+        """Close the window once the running search has finished, keeping the UI responsive meanwhile"""
+        if self._search_thread.is_alive():
+            self.root.after(CLOSE_POLL_INTERVAL_MS, self._close_when_finished)
+            return
+        self._save_and_close()
+
+    def _save_and_close(self):
+        """Save settings and destroy the window"""
         # Save language
-        self.config.set("Interface", "language", self.current_language.get())
+        self.config.set_flat(KEY_LANGUAGE, self.current_language.get())
         
         # Save search settings
-        self.config.set("Search", "regex_filter", self.regex_filter.get())
+        self.config.set_flat(KEY_REGEX_FILTER, self.regex_filter.get())
         
         # Save output settings
-        self.config.set("Output", "enable_logging", str(self.log_enabled.get()))
-        self.config.set("Output", "match_folder_structure", str(self.match_folder_structure.get()))
+        self.config.set_flat(KEY_ENABLE_LOGGING, str(self.log_enabled.get()))
+        self.config.set_flat(KEY_MATCH_FOLDER_STRUCTURE, str(self.match_folder_structure.get()))
         
         # Save paths
-        self.config.set("Paths", "default_copy_folder", self.copy_path.get())
-        self.config.set("Paths", "default_move_folder", self.move_path.get())
+        self.config.set_flat(KEY_DEFAULT_COPY_FOLDER, self.copy_path.get())
+        self.config.set_flat(KEY_DEFAULT_MOVE_FOLDER, self.move_path.get())
         
-        # Save config to file
-        self.config.save_config()
+        # Save config to file now, replacing any pending delayed save
+        if self._save_handle is not None:
+            self.root.after_cancel(self._save_handle)
+        self._do_save_config()
         self.root.destroy()
 
 def parse_args():
+    # Imported here so GUI launches without arguments never load argparse
+    import argparse
     parser = argparse.ArgumentParser(description="Batch process files using Everything search")
     parser.add_argument("--input", help="Input file containing filenames")
     parser.add_argument("--copy-to", help="Copy matching files to this folder")
@@ -960,9 +1522,17 @@ def parse_args():
     parser.add_argument("--log-path", help="Path to store log files")
     parser.add_argument("--delete", action="store_true", help="Delete matching files")
     parser.add_argument("--no-structure", action="store_true", help="Don't maintain folder structure")
+    parser.add_argument("--search-root", action="append",
+                        help="Find exact filenames by scanning this folder instead of using Everything (repeatable)")
     return parser.parse_args()
 
 def main():
+    # Launching with no arguments always opens the GUI, so skip argument parsing
+    if len(sys.argv) == 1:
+        gui = SearchGUI()
+        gui.root.mainloop()
+        return
+    
     args = parse_args()
     
     # If command line arguments are provided, run in CLI mode
@@ -973,9 +1543,11 @@ def main():
             move_path=args.move_to,
             log_path=args.log_path,
             match_folder_structure=not args.no_structure,
-            delete_mode=args.delete
+            delete_mode=args.delete,
+            search_roots=args.search_root
         )
-        searcher.process_files()
+        with searcher:
+            searcher.process_files()
     # Otherwise, launch GUI
     else:
         gui = SearchGUI()
@@ -1,14 +1,50 @@
 import os
-import json
 from typing import Dict, Optional
 
+# Use orjson for faster locale parsing when it is installed
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+def _flatten(prefix: str, node, out: Dict[str, str]) -> Dict[str, str]:
+    """Flatten nested language strings into dotted keys, using 'text' entries for dict nodes"""
+    if isinstance(node, str):
+        out[prefix] = node
+    elif isinstance(node, dict):
+        text = node.get("text")
+        if prefix and isinstance(text, str):
+            out[prefix] = text
+        for k, v in node.items():
+            _flatten(f"{prefix}.{k}" if prefix else k, v, out)
+    return out
+
+def _flatten_tooltips(data, flat_strings: Dict[str, str]) -> Dict[str, str]:
+    """Resolve every tooltip key to its text, falling back to checkbox tooltips"""
+    out = {}
+    for key in data.get("checkboxes", {}):
+        text = flat_strings.get(f"checkboxes.{key}.tooltip")
+        if text is not None:
+            out[key] = text
+    for key, tooltip in data.get("tooltips", {}).items():
+        if not tooltip:
+            continue
+        if isinstance(tooltip, dict):
+            tooltip = tooltip.get("text", "")
+        out[key] = tooltip if isinstance(tooltip, str) else ""
+    return out
+
 class LanguageManagerEverything:
     def __init__(self, initial_language: str = "English"):
         """Initialize the language manager with initial language"""
-        self.strings = {}
-        self.tooltips = {}
         self.current_language = None
         self.language_codes = {}
+        self.language_names = {}
+        # Flattened strings and tooltips for every loaded language, and those of the current one
+        self._strings_by_code = {}
+        self._tooltips_by_code = {}
+        self._strings = {}
+        self._tooltips = {}
         self._load_languages()
         
         # Set initial language, defaulting to English if specified language not found
@@ -22,30 +58,36 @@ class LanguageManagerEverything:
         localization_dir = os.path.dirname(os.path.abspath(__file__))
         
         # Load all language files
-        for file in os.listdir(localization_dir):
-            if file.startswith('everything-') and file.endswith('.json'):
+        with os.scandir(localization_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith('everything-') and name.endswith('.json')):
+                    continue
                 # Remove 'everything-' prefix and '.json' extension
-                lang_code = file[len('everything-'):-5]
-                with open(os.path.join(localization_dir, file), 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if "language" in data and "name" in data["language"]:
-                        lang_name = data["language"]["name"]
-                        self.language_codes[lang_name] = lang_code
+                lang_code = name[len('everything-'):-5]
+                with open(entry.path, 'rb') as f:
+                    data = _loads(f.read())
+                # Keep the flattened strings so switching languages needs no file I/O
+                strings = _flatten("", data, {})
+                self._strings_by_code[lang_code] = strings
+                self._tooltips_by_code[lang_code] = _flatten_tooltips(data, strings)
+                if "language" in data and "name" in data["language"]:
+                    lang_name = data["language"]["name"]
+                    self.language_codes[lang_name] = lang_code
+                    self.language_names[lang_code] = lang_name
 
     def set_language(self, language: str) -> bool:
         """Set the current language and load its strings"""
         if language in self.get_languages():
             self.current_language = language
             lang_code = self.language_codes.get(language, language)
-            lang_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"everything-{lang_code}.json")
             
-            if os.path.exists(lang_file):
-                with open(lang_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.strings = data
-                    self.tooltips = data.get("tooltips", {})
-                    return True
+            if lang_code in self._strings_by_code:
+                self._strings = self._strings_by_code[lang_code]
+                self._tooltips = self._tooltips_by_code[lang_code]
+                return True
             else:
+                lang_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"everything-{lang_code}.json")
                 raise FileNotFoundError(f"Language file missing: {lang_file}")
         return False
 
@@ -55,58 +97,22 @@ class LanguageManagerEverything:
 
     def get_string(self, key: str, *args) -> str:
         """Get a localized string by key with optional format arguments"""
-        if not key:
+        value = self._strings.get(key)
+        if value is None:
             return key
-            
-        # Split the key by dots to traverse nested dictionaries
-        keys = key.split('.')
-        value = self.strings
-        
-        # Traverse the nested structure
-        for k in keys:
-            if isinstance(value, dict):
-                if k in value:
-                    value = value[k]
-                else:
-                    return key
-            else:
-                return key
-        
-        # If we found a dict instead of a string, check for 'text' key
-        if isinstance(value, dict):
-            if 'text' in value:
-                value = value['text']
-            else:
-                return key
         
         # Format the string if arguments are provided
-        if args and isinstance(value, str):
+        if args:
             try:
                 return value.format(*args)
             except (IndexError, KeyError):
                 return value
         
-        if not isinstance(value, str):
-            return key
-            
         return value
 
     def get_tooltip(self, key: str) -> str:
         """Get a localized tooltip by key"""
-        # First check in tooltips section
-        tooltip = self.tooltips.get(key, "")
-        if tooltip:
-            if isinstance(tooltip, dict) and "text" in tooltip:
-                tooltip = tooltip["text"]
-            return tooltip if isinstance(tooltip, str) else ""
-            
-        # Then check if it's a checkbox with a tooltip
-        checkbox_key = f"checkboxes.{key}.tooltip"
-        value = self.get_string(checkbox_key)
-        if value != checkbox_key:  # If we got a real value back
-            return value
-            
-        return ""
+        return self._tooltips.get(key, "")
 
     def get_language_code(self, language_name: str) -> str:
         """Get the language code for a language name"""
@@ -114,7 +120,4 @@ class LanguageManagerEverything:
 
     def get_language_name(self, language_code: str) -> str:
         """Get the language name for a language code"""
-        for name, code in self.language_codes.items():
-            if code == language_code:
-                return name
-        return language_code 
\ No newline at end of file
+        return self.language_names.get(language_code, language_code) 
\ No newline at end of file